@@ -321,6 +321,7 @@ class FontEditorWidget(ttk.Frame):
                 self.current_char.pixels[y].append(False)
             
             self.current_char.pixels[y][x] = value
+            self.current_char.row_masks = None
             self._draw_editor()
             self._update_preview()
             
@@ -335,7 +336,8 @@ class FontEditorWidget(ttk.Frame):
         for y in range(len(self.current_char.pixels)):
             for x in range(len(self.current_char.pixels[y])):
                 self.current_char.pixels[y][x] = True
-        
+
+        self.current_char.row_masks = None
         self._draw_editor()
         self._update_preview()
     
@@ -347,7 +349,8 @@ class FontEditorWidget(ttk.Frame):
         for y in range(len(self.current_char.pixels)):
             for x in range(len(self.current_char.pixels[y])):
                 self.current_char.pixels[y][x] = False
-        
+
+        self.current_char.row_masks = None
         self._draw_editor()
         self._update_preview()
     
@@ -359,7 +362,8 @@ class FontEditorWidget(ttk.Frame):
         for y in range(len(self.current_char.pixels)):
             for x in range(len(self.current_char.pixels[y])):
                 self.current_char.pixels[y][x] = not self.current_char.pixels[y][x]
-        
+
+        self.current_char.row_masks = None
         self._draw_editor()
         self._update_preview()
     
@@ -382,7 +386,8 @@ class FontEditorWidget(ttk.Frame):
                 row.append(False)
             while len(row) > new_width:
                 row.pop()
-        
+
+        self.current_char.row_masks = None
         self._draw_editor()
         self._update_preview()
     
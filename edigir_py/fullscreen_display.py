@@ -508,19 +508,22 @@ class FullscreenGirouette(tk.Toplevel):
         px = offset_x + x * (self.pixel_size + self.pixel_gap)
         py = offset_y + y * (self.pixel_size + self.pixel_gap)
         
+        # Rectangles: Tk fills them much faster than ovals (no ellipse
+        # tessellation), and at LED size the difference is invisible
+
         # Draw glow for lit pixels
         if self.use_glow and color != self.led_off_color and self.pixel_size > 6:
             glow_color = self._get_glow_color()
             glow_size = self.pixel_size + 2
-            self.canvas.create_oval(
+            self.canvas.create_rectangle(
                 px - 1, py - 1,
                 px + glow_size, py + glow_size,
                 fill=glow_color,
                 outline=""
             )
-        
+
         # Draw LED
-        self.canvas.create_oval(
+        self.canvas.create_rectangle(
             px, py,
             px + self.pixel_size, py + self.pixel_size,
             fill=color,
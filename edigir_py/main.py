@@ -19,6 +19,76 @@ from .fullscreen_display import FullscreenGirouette, ScreenDetectionDialog
 from .image_export import ImageExporter, check_pil_available, get_supported_formats
 
 
+# File-dialog filetypes, built once instead of per dialog invocation
+_FONT_FILETYPES = (
+    ("Fichiers police", "*.pol"),
+    ("Tous les fichiers", "*.*"),
+)
+_FONT_SAVE_FILETYPES = (("Fichiers police", "*.pol"),)
+
+# Help window content (compiled once at import)
+_HELP_TEXT = """
+MANUEL D'UTILISATION - EDIGIR
+
+Edigir est un éditeur de messages pour girouettes LED de transports en commun.
+
+FONCTIONNALITÉS PRINCIPALES:
+
+1. ÉDITEUR DE DESTINATIONS
+   - Créer et modifier des messages de destination
+   - Jusqu'à 3 alternances par message
+   - Support des girouettes avant, latérale et arrière
+
+2. ÉDITEUR DE POLICES
+   - Personnaliser les caractères LED
+   - Support de plusieurs polices (0-5, A-F)
+   - Édition pixel par pixel
+
+3. SIMULATION
+   - Aperçu en temps réel des messages
+   - Animation défilante
+   - Prévisualisation des couleurs
+
+4. MODE GIROUETTE (PLEIN ÉCRAN)
+   - Transforme l'écran de votre ordinateur en afficheur de bus
+   - Affichage LED réaliste en plein écran
+   - Navigation par clavier entre messages et alternances
+   - Cycle automatique des alternances avec durées configurées
+   - Plusieurs couleurs LED disponibles (ambre, vert, rouge, jaune, blanc)
+
+RACCOURCIS CLAVIER:
+   Ctrl+N     Nouveau fichier
+   Ctrl+O     Ouvrir fichier
+   Ctrl+S     Enregistrer
+   Ctrl+P     Éditeur de polices
+   Ctrl+G     Configuration girouettes
+   Ctrl+R     Visualisation rapide
+   Ctrl+U     Simulation
+   F11        Mode Girouette (plein écran)
+   Page Up    Message précédent
+   Page Down  Message suivant
+   F1         Aide
+
+MODE GIROUETTE - COMMANDES:
+   ESC        Quitter le mode plein écran
+   ←/→        Message précédent/suivant
+   ↑/↓        Alternance précédente/suivante
+   ESPACE     Démarrer/Arrêter le cycle automatique
+   C          Changer la couleur LED
+   H          Afficher/Masquer les informations
+   F          Basculer plein écran/fenêtré
+
+CARACTÈRES SPÉCIAUX:
+   | (pipe)   Saut de ligne
+   ²          Saut de colonne (1 pixel)
+
+FORMAT DES MESSAGES:
+   - Numéros de 1 à 9999
+   - Maximum 240 caractères par message
+   - Maximum 1600 colonnes pour texte défilant
+"""
+
+
 class EditorApplication(tk.Tk):
     """Main application window."""
     
@@ -38,6 +108,12 @@ class EditorApplication(tk.Tk):
         self.current_display_type: str = "front"
         self.modified: bool = False
         self.current_file: Optional[str] = None
+
+        # Signature of the last rendered preview, to skip redundant redraws
+        self._last_preview: Optional[tuple] = None
+
+        # Help window, built once and re-shown on subsequent F1 presses
+        self._help_window: Optional[tk.Toplevel] = None
         
         # Load default display configs
         self._load_default_configs()
@@ -745,10 +821,13 @@ class EditorApplication(tk.Tk):
             idx = nums.index(self.current_message_num)
             new_idx = max(0, min(len(nums) - 1, idx + delta))
             self.current_message_num = nums[new_idx]
-            self._update_ui()
         except ValueError:
             self.current_message_num = nums[0]
-            self._update_ui()
+
+        # Only the selection moved; the message list itself is unchanged,
+        # so skip the full combo repopulation
+        self._update_current_selection()
+        self._load_current_message()
     
     def _change_message_number(self):
         """Change current message number."""
@@ -773,17 +852,24 @@ class EditorApplication(tk.Tk):
                 new_num = int(num_var.get())
                 if new_num < 1 or new_num > 9999:
                     raise ValueError("Numéro invalide (1-9999)")
-                if new_num != current and new_num in self.project.messages:
-                    raise ValueError("Ce numéro existe déjà")
-                
+
                 if new_num != current:
-                    msg = self.project.messages.pop(current)
+                    messages = self.project.messages
+                    # Single lookup: a hit means the number is taken,
+                    # a miss means we can renumber without re-probing.
+                    try:
+                        messages[new_num]
+                    except KeyError:
+                        pass
+                    else:
+                        raise ValueError("Ce numéro existe déjà")
+                    msg = messages.pop(current)
                     msg.number = new_num
-                    self.project.messages[new_num] = msg
+                    messages[new_num] = msg
                     self.current_message_num = new_num
                     self.modified = True
                     self._update_ui()
-                
+
                 dialog.destroy()
             except ValueError as e:
                 messagebox.showerror("Erreur", str(e))
@@ -817,19 +903,26 @@ class EditorApplication(tk.Tk):
     
     # --- UI updates ---
     
-    def _update_ui(self):
-        """Update all UI elements."""
-        # Update message combo
+    def _update_message_list(self):
+        """Repopulate the message combo (structural change in the list)."""
         nums = self.project.get_sorted_message_numbers()
         values = []
         for num in nums:
             msg = self.project.get_message(num)
             preview = msg.alternances[0].text[:20] if msg.alternances[0].text else ""
             values.append(f"{num} - {preview}")
-        
+
         self.msg_combo['values'] = values
+
+    def _update_current_selection(self):
+        """Reflect the current message number without rebuilding the list."""
         self.msg_num_var.set(str(self.current_message_num))
-        
+
+    def _update_ui(self):
+        """Update all UI elements."""
+        self._update_message_list()
+        self._update_current_selection()
+
         # Update file label
         if self.current_file:
             name = os.path.basename(self.current_file)
@@ -841,6 +934,7 @@ class EditorApplication(tk.Tk):
         if self.project.front_display:
             self.display_type_label.config(text=self.project.front_display.name)
             self.display_preview.set_display_config(self.project.front_display)
+            self._last_preview = None  # Geometry changed, force a redraw
         
         # Load current message
         self._load_current_message()
@@ -929,6 +1023,15 @@ class EditorApplication(tk.Tk):
         # Apply font to selected text (future enhancement)
         pass
     
+    def _invalidate_preview(self):
+        """Force the next preview update to re-render."""
+        self._last_preview = None
+
+    def _on_fonts_edited(self):
+        """Handle an in-place glyph edit from the font editor."""
+        self._invalidate_preview()
+        self._update_preview()
+
     def _update_preview(self):
         """Update the LED preview."""
         msg = self.project.get_message(self.current_message_num)
@@ -944,12 +1047,18 @@ class EditorApplication(tk.Tk):
         elif msg.alternances[2].text:
             text += msg.alternances[2].text
         
+        # Skip the canvas redraw when the rendered content is unchanged
+        # (e.g. edits to durations or non-displayed alternances)
+        fonts = "2" * len(text)  # Default to font 2
+        if (text, fonts) == self._last_preview:
+            return
+        self._last_preview = (text, fonts)
+
         # Set fonts for preview
         if self.project.fonts:
             self.display_preview.set_fonts(self.project.fonts)
-        
+
         # Render
-        fonts = "2" * len(text)  # Default to font 2
         self.display_preview.render_text(text, fonts)
     
     def _play_animation(self):
@@ -1065,16 +1174,14 @@ class EditorApplication(tk.Tk):
         """Load a font file."""
         filename = filedialog.askopenfilename(
             title="Charger une police",
-            filetypes=[
-                ("Fichiers police", "*.pol"),
-                ("Tous les fichiers", "*.*")
-            ]
+            filetypes=_FONT_FILETYPES
         )
         
         if filename:
             try:
                 self.project.fonts = POLParser.parse(filename)
                 self.project.font_file = filename
+                self._last_preview = None  # New glyphs, force a redraw
                 self._update_preview()
                 self._set_status(f"Police chargée: {os.path.basename(filename)}")
             except Exception as e:
@@ -1089,7 +1196,7 @@ class EditorApplication(tk.Tk):
         filename = filedialog.asksaveasfilename(
             title="Enregistrer la police",
             defaultextension=".pol",
-            filetypes=[("Fichiers police", "*.pol")]
+            filetypes=_FONT_SAVE_FILETYPES
         )
         
         if filename:
@@ -1111,6 +1218,16 @@ class EditorApplication(tk.Tk):
         # Create font editor widget
         editor = FontEditorWidget(editor_window)
         editor.pack(fill=tk.BOTH, expand=True)
+
+        # The editor mutates the shared FontCharacter objects in place, so
+        # the preview's unchanged-content short-circuit must be dropped as
+        # glyphs change — and again when the window closes, covering the
+        # bulk tools that do not fire the change callback
+        editor.set_on_change_callback(self._on_fonts_edited)
+        editor_window.bind(
+            '<Destroy>',
+            lambda e: self._invalidate_preview() if e.widget is editor_window else None,
+        )
         
         # Set fonts
         if self.project.fonts:
@@ -1195,7 +1312,8 @@ class EditorApplication(tk.Tk):
                 item = tree.item(selection[0])
                 num = item['values'][0]
                 self.current_message_num = num
-                self._update_ui()
+                self._update_current_selection()
+                self._load_current_message()
                 view_window.destroy()
         
         tree.bind('<Double-1>', on_select)
@@ -1241,15 +1359,29 @@ class EditorApplication(tk.Tk):
             preview.pack(fill=tk.X, padx=10, pady=10)
             previews.append(preview)
         
+        # Last (text, fonts) rendered per preview, to skip unchanged rows
+        last_rendered = [None] * len(previews)
+
         def update_display():
             num = msg_num_var.get()
             msg = self.project.get_message(num)
-            if msg:
-                for i, preview in enumerate(previews):
-                    if i < len(msg.alternances):
-                        text = msg.header + msg.alternances[i].text
-                        fonts = "2" * len(text)
-                        preview.render_text(text, fonts)
+            if not msg:
+                return
+
+            # Collect all pairs first, then update only the previews
+            # whose content actually changed (one invalidation each)
+            pairs = []
+            for i in range(len(previews)):
+                if i < len(msg.alternances):
+                    text = msg.header + msg.alternances[i].text
+                    pairs.append((text, "2" * len(text)))
+                else:
+                    pairs.append(("", ""))
+
+            for i, (preview, pair) in enumerate(zip(previews, pairs)):
+                if pair != last_rendered[i]:
+                    preview.render_text(*pair)
+                    last_rendered[i] = pair
         
         def navigate(delta):
             nums = self.project.get_sorted_message_numbers()
@@ -1287,7 +1419,13 @@ class EditorApplication(tk.Tk):
     
     def _show_help(self):
         """Show help window."""
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+
         help_window = tk.Toplevel(self)
+        self._help_window = help_window
         help_window.title("Aide - Edigir")
         help_window.geometry("700x500")
         help_window.transient(self)
@@ -1299,68 +1437,7 @@ class EditorApplication(tk.Tk):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         text.configure(yscrollcommand=scrollbar.set)
         
-        help_text = """
-MANUEL D'UTILISATION - EDIGIR
-
-Edigir est un éditeur de messages pour girouettes LED de transports en commun.
-
-FONCTIONNALITÉS PRINCIPALES:
-
-1. ÉDITEUR DE DESTINATIONS
-   - Créer et modifier des messages de destination
-   - Jusqu'à 3 alternances par message
-   - Support des girouettes avant, latérale et arrière
-
-2. ÉDITEUR DE POLICES
-   - Personnaliser les caractères LED
-   - Support de plusieurs polices (0-5, A-F)
-   - Édition pixel par pixel
-
-3. SIMULATION
-   - Aperçu en temps réel des messages
-   - Animation défilante
-   - Prévisualisation des couleurs
-
-4. MODE GIROUETTE (PLEIN ÉCRAN)
-   - Transforme l'écran de votre ordinateur en afficheur de bus
-   - Affichage LED réaliste en plein écran
-   - Navigation par clavier entre messages et alternances
-   - Cycle automatique des alternances avec durées configurées
-   - Plusieurs couleurs LED disponibles (ambre, vert, rouge, jaune, blanc)
-
-RACCOURCIS CLAVIER:
-   Ctrl+N     Nouveau fichier
-   Ctrl+O     Ouvrir fichier
-   Ctrl+S     Enregistrer
-   Ctrl+P     Éditeur de polices
-   Ctrl+G     Configuration girouettes
-   Ctrl+R     Visualisation rapide
-   Ctrl+U     Simulation
-   F11        Mode Girouette (plein écran)
-   Page Up    Message précédent
-   Page Down  Message suivant
-   F1         Aide
-
-MODE GIROUETTE - COMMANDES:
-   ESC        Quitter le mode plein écran
-   ←/→        Message précédent/suivant
-   ↑/↓        Alternance précédente/suivante
-   ESPACE     Démarrer/Arrêter le cycle automatique
-   C          Changer la couleur LED
-   H          Afficher/Masquer les informations
-   F          Basculer plein écran/fenêtré
-
-CARACTÈRES SPÉCIAUX:
-   | (pipe)   Saut de ligne
-   ²          Saut de colonne (1 pixel)
-
-FORMAT DES MESSAGES:
-   - Numéros de 1 à 9999
-   - Maximum 240 caractères par message
-   - Maximum 1600 colonnes pour texte défilant
-        """
-        
-        text.insert('1.0', help_text)
+        text.insert('1.0', _HELP_TEXT)
         text.configure(state='disabled')
     
     def _show_about(self):
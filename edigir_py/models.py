@@ -25,7 +25,7 @@ class AnimationType(Enum):
     FADE = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """Configuration for a display (girouette)."""
     name: str
@@ -43,7 +43,7 @@ class DisplayConfig:
         return self.height2 > 0 and self.width2 > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Alternance:
     """One alternance (variant) of a message."""
     text: str = ""
@@ -54,7 +54,7 @@ class Alternance:
     bg_color: int = 0  # Index in palette
 
 
-@dataclass  
+@dataclass(slots=True)
 class Message:
     """A destination message with multiple alternances."""
     number: int  # Message number (1-9999)
@@ -75,20 +75,23 @@ class Message:
     stop_list_end: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FontCharacter:
     """A single character in a font."""
     char: str
     width: int
     height: int
     pixels: List[List[bool]] = field(default_factory=list)
-    
+    # Per-row lit bitmasks (bit x = column x), packed by the renderer when
+    # the font is loaded; None until then
+    row_masks: Optional[List[int]] = None
+
     def __post_init__(self):
         if not self.pixels:
             self.pixels = [[False] * self.width for _ in range(self.height)]
 
 
-@dataclass
+@dataclass(slots=True)
 class Font:
     """A complete font for LED display."""
     name: str
@@ -101,7 +104,7 @@ class Font:
         return self.characters.get(char)
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorEntry:
     """A color in the palette."""
     rgb_hex: str  # RGB hex color for display
@@ -109,19 +112,47 @@ class ColorEntry:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Palette:
     """Color palette for LED displays."""
     colors: List[ColorEntry] = field(default_factory=list)
-    
+
+    # Reverse lookup maps, rebuilt lazily when colors change
+    _by_name: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _by_led: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _indexed_count: int = field(default=-1, init=False, repr=False)
+
     def get_color(self, index: int) -> Optional[ColorEntry]:
         """Get a color by index."""
         if 0 <= index < len(self.colors):
             return self.colors[index]
         return None
 
+    def _index_colors(self):
+        """Rebuild the reverse lookup maps from the colors list."""
+        self._by_name = {c.name: i for i, c in enumerate(self.colors)}
+        self._by_led = {c.led_hex: i for i, c in enumerate(self.colors)}
+        self._indexed_count = len(self.colors)
+
+    def get_index_by_name(self, name: str) -> Optional[int]:
+        """Get a color index by name (O(1) after first call)."""
+        if self._indexed_count != len(self.colors):
+            self._index_colors()
+        return self._by_name.get(name)
+
+    def get_index_by_led(self, led_hex: str) -> Optional[int]:
+        """Get a color index by LED hex value (O(1) after first call)."""
+        if self._indexed_count != len(self.colors):
+            self._index_colors()
+        return self._by_led.get(led_hex)
+
+    def get_color_by_name(self, name: str) -> Optional[ColorEntry]:
+        """Get a color by name."""
+        index = self.get_index_by_name(name)
+        return self.colors[index] if index is not None else None
+
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Complete Edigir project."""
     version: str = "2.0"
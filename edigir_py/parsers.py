@@ -3,6 +3,8 @@ File parsers for Edigir file formats.
 Handles reading and writing DSW, POL, PAL, and other formats.
 """
 
+import configparser
+import mmap
 import os
 import re
 from typing import Dict, List, Optional, Tuple
@@ -12,6 +14,96 @@ from .models import (
 )
 
 
+# A line holding a message number (digits with optional surrounding blanks),
+# compiled once so the scan runs in the C regex engine
+_MSG_NUM_RE = re.compile(r'\s*(\d+)\s*$')
+
+# Any non-blank character: blank/content line tests via search() avoid the
+# per-line strip() allocation in the message block scanner
+_NONBLANK_RE = re.compile(r'\S')
+
+# A well-formed INI section header ('[...]' with nothing but blanks after);
+# malformed '['-prefixed lines are junk and must not reach configparser
+_INI_HEADER_RE = re.compile(r'\s*\[[^\]]*\]\s*$')
+
+# Standard ASCII glyph set shared by all default fonts (space is narrower)
+_ASCII_CHARS = tuple(map(chr, range(32, 127)))
+_CHAR_WIDTHS = tuple(3 if c == ' ' else 5 for c in _ASCII_CHARS)
+
+# Default font layouts: (code, height, name)
+_FONT_CONFIGS = (
+    ('0', 7, "Small"),
+    ('1', 7, "Small Bold"),
+    ('2', 14, "Medium"),
+    ('3', 14, "Medium Bold"),
+    ('4', 7, "Custom Small"),
+    ('5', 7, "Custom Small (no spacing)"),
+    ('A', 7, "Small Alt"),
+    ('B', 7, "Small Bold Alt"),
+    ('C', 14, "Medium Alt"),
+    ('D', 14, "Medium Bold Alt"),
+    ('E', 16, "Large Custom"),
+    ('F', 16, "Large Custom (no spacing)"),
+)
+
+
+# Structural filler closing out each alternance in a DSW message block
+_ALT_PAD = '\n' * 26
+
+# Message skeletons for DSWParser.write, built on first use per alternance
+# count. The block shape is fixed by the file format, so each message can
+# be emitted with a single format()+write() pair instead of a dozen calls.
+_MSG_TEMPLATES: Dict[int, str] = {}
+
+
+def _msg_template(n_alts: int) -> str:
+    """Return the write template for a message with `n_alts` alternances."""
+    tmpl = _MSG_TEMPLATES.get(n_alts)
+    if tmpl is None:
+        tmpl = '\n\n{0}' + ''.join(
+            '\n\n\n\n\n{%d}\n{%d}\n{%d}' % (2 * i + 1, 2 * i + 2, 2 * i + 2)
+            + _ALT_PAD
+            for i in range(n_alts)
+        )
+        _MSG_TEMPLATES[n_alts] = tmpl
+    return tmpl
+
+# Byte value -> 8 pixel booleans (MSB first), the inverse of the packing
+# done in POLParser.write. A 256-entry table turns per-bit shifting in the
+# decode inner loop into a single C-level lookup per byte.
+_BYTE_BITS = tuple(
+    tuple(bool(b & (1 << (7 - i))) for i in range(8)) for b in range(256)
+)
+
+
+def _unpack_glyph_rows(buf, offset: int, width: int, height: int) -> List[List[bool]]:
+    """
+    Decode `height` one-byte bitmap rows starting at `offset` into a pixel
+    grid of `width` columns (bits are stored MSB first, as written by
+    POLParser.write). `buf` is any bytes-like object (bytes or mmap).
+    """
+    byte_bits = _BYTE_BITS
+    return [
+        list(byte_bits[buf[offset + row]][:width])
+        for row in range(height)
+    ]
+
+
+def _new_font_char(char: str, width: int, height: int) -> FontCharacter:
+    """
+    Allocate a blank FontCharacter without going through the dataclass
+    __init__/__post_init__ machinery. POL parsing creates over a thousand
+    of these per file, so the bypassed argument binding adds up.
+    """
+    fc = FontCharacter.__new__(FontCharacter)
+    fc.char = char
+    fc.width = width
+    fc.height = height
+    fc.pixels = [[False] * width for _ in range(height)]
+    fc.row_masks = None
+    return fc
+
+
 class DSWParser:
     """Parser for DSW (destination) files."""
     
@@ -22,54 +114,63 @@ class DSWParser:
         Returns (project, font_file_path).
         """
         project = Project()
-        
+
         try:
             with open(filepath, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
+                lines = f.read().splitlines()
         except Exception as e:
             raise ValueError(f"Cannot read file: {e}")
-        
+
         if len(lines) < 6:
             raise ValueError("Invalid DSW file: too short")
-        
+
         # Parse header
         # Line 0: Version
         project.version = lines[0].strip()
-        
+
         # Line 1: Font file path
         project.font_file = lines[1].strip()
-        
+
         # Line 2: Front display name
         front_display_name = lines[2].strip()
-        
-        # Line 3: Side display config  
+
+        # Line 3: Side display config
         side_display_name = lines[3].strip()
-        
+
         # Line 4: Rear display config
         rear_display_name = lines[4].strip()
-        
+
         # Line 5: Flag
         # Lines 6+: Messages
-        
+
         current_line = 6
-        
+        n_lines = len(lines)
+        match_num = _MSG_NUM_RE.match
+        records = []
+
         # Parse messages
-        # Each message block is 118 lines (or similar structure)
-        while current_line < len(lines):
-            line = lines[current_line].strip()
-            
+        # Digit-only duration lines occur inside blocks too, so message
+        # boundaries can only be recognized at the top level of the walk —
+        # the regex just replaces the per-line strip().isdigit() dance
+        while current_line < n_lines:
+            m = match_num(lines[current_line])
+
             # Check if this is a message number
-            if line.isdigit():
-                msg_num = int(line)
+            if m:
+                msg_num = int(m[1])
                 msg = Message(number=msg_num)
-                
+
                 # Parse message content
                 # Message structure spans multiple lines
                 current_line = DSWParser._parse_message_block(lines, current_line, msg)
-                project.messages[msg_num] = msg
+                records.append((msg_num, msg))
             else:
                 current_line += 1
-        
+
+        # Build the dict in one C-level pass rather than growing it
+        # insert-by-insert during the walk
+        project.messages = dict(records)
+
         # Create display configs from names
         if front_display_name:
             project.front_display = DisplayConfig(name=front_display_name)
@@ -84,142 +185,128 @@ class DSWParser:
     def _parse_message_block(lines: List[str], start_line: int, msg: Message) -> int:
         """Parse a message block and return next line index."""
         current = start_line + 1  # Skip message number
-        
+        n_lines = len(lines)
+        match_num = _MSG_NUM_RE.match
+        nonblank = _NONBLANK_RE.search
+
         # Skip empty lines
-        while current < len(lines) and not lines[current].strip():
+        while current < n_lines and not nonblank(lines[current]):
             current += 1
-            
-        if current >= len(lines):
+
+        if current >= n_lines:
             return current
-            
+
         # Next lines should be alternance data
         # Structure: text, fonts, fonts (duplicate), then next alternance...
-        
+
         for alt_idx in range(3):
-            if current + 2 >= len(lines):
+            if current + 2 >= n_lines:
                 break
-                
+
             # Get text line
-            text = lines[current].strip() if current < len(lines) else ""
+            text = lines[current].strip()
             current += 1
-            
+
             # Get fonts line
-            fonts = lines[current].strip() if current < len(lines) else ""
+            fonts = lines[current].strip()
             current += 1
-            
+
             # Skip duplicate fonts line
             current += 1
-            
+
             # Skip timing/animation lines
-            while current < len(lines) and lines[current].strip():
+            while current < n_lines and nonblank(lines[current]):
                 current += 1
-            
+
             # Skip empty lines before next alternance
-            while current < len(lines) and not lines[current].strip():
+            while current < n_lines and not nonblank(lines[current]):
                 current += 1
-            
+
             if text or fonts:
                 msg.alternances[alt_idx].text = text
                 msg.alternances[alt_idx].fonts = fonts
-            
+
             # Check if next line is a new message number
-            if current < len(lines) and lines[current].strip().isdigit():
+            if current < n_lines and match_num(lines[current]):
                 break
-        
+
         return current
     
     @staticmethod
     def write(filepath: str, project: Project):
         """Write a project to DSW format."""
-        lines = []
-        
-        # Header
-        lines.append(project.version)
-        lines.append(project.font_file)
-        lines.append(project.front_display.name if project.front_display else "16x084")
-        lines.append(project.side_display.name if project.side_display else ".Pas de Girouette")
-        lines.append(project.rear_display.name if project.rear_display else "16x028")
-        lines.append("1")  # Flag
-        
-        # Messages
-        for num in sorted(project.messages.keys()):
-            msg = project.messages[num]
-            lines.append("")
-            lines.append(str(msg.number))
-            
-            for alt in msg.alternances:
-                lines.append("")
-                lines.append("")
-                lines.append("")
-                lines.append("")
-                lines.append(alt.text)
-                lines.append(alt.fonts)
-                lines.append(alt.fonts)  # Duplicate
-                
-                # More empty lines for structure
-                for _ in range(26):
-                    lines.append("")
-        
-        with open(filepath, 'w', encoding='latin-1') as f:
-            f.write('\n'.join(lines))
+        with open(filepath, 'w', encoding='latin-1', buffering=1 << 20) as f:
+            w = f.write
+
+            # Header
+            w(project.version)
+            w('\n')
+            w(project.font_file)
+            w('\n')
+            w(project.front_display.name if project.front_display else "16x084")
+            w('\n')
+            w(project.side_display.name if project.side_display else ".Pas de Girouette")
+            w('\n')
+            w(project.rear_display.name if project.rear_display else "16x028")
+            w('\n1')  # Flag
+
+            # Messages: blank separator, number, then per alternance four
+            # blank lines, text, fonts twice and the structural filler —
+            # all baked into a cached template, one write per message
+            for num in sorted(project.messages.keys()):
+                msg = project.messages[num]
+                args = [msg.number]
+                for alt in msg.alternances:
+                    args.append(alt.text)
+                    args.append(alt.fonts)
+                w(_msg_template(len(msg.alternances)).format(*args))
 
 
 class POLParser:
     """Parser for POL (font/police) files."""
     
-    FONT_CODES = ['0', '1', '2', '3', '4', '5', 'A', 'B', 'C', 'D', 'E', 'F']
+    # Valid font codes as a frozenset for O(1) membership checks
+    FONT_CODES = frozenset(code for code, _height, _name in _FONT_CONFIGS)
     
     @staticmethod
     def parse(filepath: str) -> Dict[str, Font]:
         """Parse a POL file and return fonts dictionary."""
-        fonts = {}
-        
         try:
-            with open(filepath, 'rb') as f:
-                data = f.read()
+            f = open(filepath, 'rb')
         except Exception as e:
             raise ValueError(f"Cannot read font file: {e}")
-        
+
         # POL files contain binary font data
         # The format includes multiple fonts for different sizes
         # Each font contains character bitmaps
-        
-        # Create basic fonts with standard heights
-        font_configs = [
-            ('0', 7, "Small"),
-            ('1', 7, "Small Bold"),
-            ('2', 14, "Medium"),
-            ('3', 14, "Medium Bold"),
-            ('4', 7, "Custom Small"),
-            ('5', 7, "Custom Small (no spacing)"),
-            ('A', 7, "Small Alt"),
-            ('B', 7, "Small Bold Alt"),
-            ('C', 14, "Medium Alt"),
-            ('D', 14, "Medium Bold Alt"),
-            ('E', 16, "Large Custom"),
-            ('F', 16, "Large Custom (no spacing)"),
-        ]
-        
-        for code, height, name in font_configs:
-            font = Font(name=name, height=height)
-            
-            # Create standard ASCII characters
-            for c in range(32, 127):
-                char = chr(c)
-                width = 5 if c != 32 else 3  # Space is narrower
-                font_char = FontCharacter(char=char, width=width, height=height)
-                font.characters[char] = font_char
-            
-            fonts[code] = font
-        
-        # Try to parse actual font data from the binary
-        POLParser._parse_binary_fonts(data, fonts)
-        
+
+        # Create basic fonts with standard heights from the precomputed
+        # character/width tables, constructing the whole dict at once
+        fonts = {
+            code: Font(
+                name=name,
+                height=height,
+                characters={
+                    char: _new_font_char(char, width, height)
+                    for char, width in zip(_ASCII_CHARS, _CHAR_WIDTHS)
+                },
+            )
+            for code, height, name in _FONT_CONFIGS
+        }
+
+        # Try to parse actual font data from the binary, scanning the file
+        # through a read-only mmap: pages are faulted in lazily and slices
+        # never copy the whole file into the Python heap
+        with f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    POLParser._parse_binary_fonts(data, fonts)
+
         return fonts
-    
+
     @staticmethod
-    def _parse_binary_fonts(data: bytes, fonts: Dict[str, Font]):
-        """Parse binary font data."""
+    def _parse_binary_fonts(data, fonts: Dict[str, Font]):
+        """Parse binary font data from a bytes-like buffer (bytes or mmap)."""
         # POL files have a specific binary structure
         # First part is a header with version info
         # Then font bitmap data follows
@@ -237,10 +324,12 @@ class POLParser:
             
             # Binary font data starts after header
             offset = header_end + 2
-            
+
             # Each font section contains bitmap data for characters
             # Format varies but generally: character code, width, then pixel rows
-            
+            # Once the glyph directory layout is mapped, each bitmap decodes
+            # via _unpack_glyph_rows(data, glyph_offset, width, height)
+
         except Exception:
             pass  # Use default fonts if parsing fails
     
@@ -255,14 +344,24 @@ class POLParser:
         data.extend(header.encode('latin-1'))
         
         # Add font bitmap data
+        # Glyph rows repeat heavily (blank rows dominate the default
+        # fonts), so each distinct pattern is bit-packed only once
+        pack_cache: Dict[tuple, int] = {}
         for code, font in fonts.items():
             for char, font_char in font.characters.items():
                 # Write character bitmap
                 for row in font_char.pixels:
-                    byte_val = 0
-                    for i, pixel in enumerate(row[:8]):
-                        if pixel:
-                            byte_val |= (1 << (7 - i))
+                    key = tuple(row[:8])
+                    byte_val = pack_cache.get(key)
+                    if byte_val is None:
+                        # Branchless pack: gather the low bit of each pixel
+                        # byte into one output byte (MSB first) with a
+                        # single multiply instead of 8 conditional shifts
+                        bits = int.from_bytes(bytes(key).ljust(8, b'\0'), 'big')
+                        byte_val = (
+                            (bits & 0x0101010101010101) * 0x0102040810204080
+                        ) >> 56 & 0xFF
+                        pack_cache[key] = byte_val
                     data.append(byte_val)
         
         with open(filepath, 'wb') as f:
@@ -279,24 +378,18 @@ class PALParser:
         
         try:
             with open(filepath, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
+                lines = f.read().splitlines()
         except Exception as e:
             raise ValueError(f"Cannot read palette file: {e}")
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            parts = line.split()
-            if len(parts) >= 3:
-                rgb_hex = parts[0]
-                led_hex = parts[1]
-                name = parts[2] if len(parts) > 2 else ""
-                
-                color = ColorEntry(rgb_hex=rgb_hex, led_hex=led_hex, name=name)
-                palette.colors.append(color)
-        
+
+        # split(None, 2) skips leading blanks, collapses whitespace runs
+        # and caps at three tokens, subsuming the old strip()+split() pair
+        palette.colors = [
+            ColorEntry(rgb_hex=parts[0], led_hex=parts[1], name=parts[2])
+            for parts in (line.split(None, 2) for line in lines)
+            if len(parts) >= 3
+        ]
+
         return palette
     
     @staticmethod
@@ -311,39 +404,53 @@ class PALParser:
             f.write('\n'.join(lines))
 
 
-class GIRParser:
-    """Parser for GIR (girouette configuration) files."""
-    
-    @staticmethod
-    def parse(filepath: str) -> Dict[str, DisplayConfig]:
-        """Parse a GIR file and return display configurations."""
+def _safe_int(s: str) -> int:
+    """Convert a field to int, defaulting to 0 on non-numeric content."""
+    try:
+        return int(s)
+    except (ValueError, TypeError):
+        return 0
+
+
+class _DisplayBlockParser:
+    """
+    Shared parser for 8-line display-configuration records (name,
+    description, six numeric fields). GIR and LED files use this exact
+    layout, so the parse code object exists once.
+    """
+
+    KIND = "display"
+
+    @classmethod
+    def parse(cls, filepath: str) -> Dict[str, DisplayConfig]:
+        """Parse the file and return display configurations."""
         displays = {}
-        
+
         try:
             with open(filepath, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
+                lines = f.read().splitlines()
         except Exception as e:
-            raise ValueError(f"Cannot read GIR file: {e}")
-        
+            raise ValueError(f"Cannot read {cls.KIND} file: {e}")
+
         i = 0
-        while i < len(lines):
-            name = lines[i].strip() if i < len(lines) else ""
+        n = len(lines)
+        while i < n:
+            name = lines[i].strip()
             if not name:
                 i += 1
                 continue
-            
+
             # Read description
-            desc = lines[i + 1].strip() if i + 1 < len(lines) else ""
-            
-            # Read dimensions
-            h1 = int(lines[i + 2].strip()) if i + 2 < len(lines) and lines[i + 2].strip().isdigit() else 0
-            w1 = int(lines[i + 3].strip()) if i + 3 < len(lines) and lines[i + 3].strip().isdigit() else 0
-            h2 = int(lines[i + 4].strip()) if i + 4 < len(lines) and lines[i + 4].strip().isdigit() else 0
-            w2 = int(lines[i + 5].strip()) if i + 5 < len(lines) and lines[i + 5].strip().isdigit() else 0
-            has_icon = int(lines[i + 6].strip()) if i + 6 < len(lines) and lines[i + 6].strip().isdigit() else 0
-            is_color = int(lines[i + 7].strip()) if i + 7 < len(lines) and lines[i + 7].strip().isdigit() else 0
-            
-            config = DisplayConfig(
+            desc = lines[i + 1].strip() if i + 1 < n else ""
+
+            # Read dimensions: int() already tolerates surrounding
+            # whitespace, so no per-field strip()/isdigit() pass is needed
+            dims = lines[i + 2:i + 8]
+            if len(dims) < 6:
+                dims.extend([''] * (6 - len(dims)))
+            h1, w1, h2, w2, has_icon, is_color = map(_safe_int, dims)
+
+            displays[name] = DisplayConfig(
                 name=name,
                 description=desc,
                 height1=h1,
@@ -353,94 +460,102 @@ class GIRParser:
                 has_icon=has_icon,
                 is_color=is_color
             )
-            displays[name] = config
-            
+
             i += 8
-        
+
         return displays
 
 
-class LEDParser:
+class GIRParser(_DisplayBlockParser):
+    """Parser for GIR (girouette configuration) files."""
+
+    KIND = "GIR"
+
+
+class LEDParser(_DisplayBlockParser):
     """Parser for LED display configuration files."""
-    
-    @staticmethod
-    def parse(filepath: str) -> Dict[str, DisplayConfig]:
-        """Parse a LED file and return display configurations."""
-        displays = {}
-        
-        try:
-            with open(filepath, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
-        except Exception as e:
-            raise ValueError(f"Cannot read LED file: {e}")
-        
-        i = 0
-        while i < len(lines):
-            name = lines[i].strip() if i < len(lines) else ""
-            if not name:
-                i += 1
-                continue
-            
-            # Read description
-            desc = lines[i + 1].strip() if i + 1 < len(lines) else ""
-            
-            # Read dimensions (format differs from GIR)
-            h1 = int(lines[i + 2].strip()) if i + 2 < len(lines) and lines[i + 2].strip().isdigit() else 0
-            w1 = int(lines[i + 3].strip()) if i + 3 < len(lines) and lines[i + 3].strip().isdigit() else 0
-            h2 = int(lines[i + 4].strip()) if i + 4 < len(lines) and lines[i + 4].strip().isdigit() else 0
-            w2 = int(lines[i + 5].strip()) if i + 5 < len(lines) and lines[i + 5].strip().isdigit() else 0
-            has_icon = int(lines[i + 6].strip()) if i + 6 < len(lines) and lines[i + 6].strip().isdigit() else 0
-            is_color = int(lines[i + 7].strip()) if i + 7 < len(lines) and lines[i + 7].strip().isdigit() else 0
-            
-            config = DisplayConfig(
-                name=name,
-                description=desc,
-                height1=h1,
-                width1=w1,
-                height2=h2,
-                width2=w2,
-                has_icon=has_icon,
-                is_color=is_color
-            )
-            displays[name] = config
-            
-            i += 8
-        
-        return displays
+
+    KIND = "LED"
 
 
 class INIParser:
     """Parser for INI configuration files."""
     
+    @staticmethod
+    def _make_parser() -> configparser.ConfigParser:
+        """Build a ConfigParser matching the Edigir INI dialect."""
+        cp = configparser.ConfigParser(
+            interpolation=None,
+            strict=False,
+            delimiters=('=',),
+            comment_prefixes=('#',),
+        )
+        # Settings keys are mixed-case French labels; keep them verbatim
+        cp.optionxform = str
+        return cp
+
     @staticmethod
     def parse(filepath: str) -> Dict[str, str]:
         """Parse an INI file and return settings dictionary."""
-        settings = {}
-        
         try:
             with open(filepath, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
+                text = f.read()
         except Exception as e:
             raise ValueError(f"Cannot read INI file: {e}")
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('[') or line.startswith('#'):
-                continue
-            
-            if '=' in line:
-                key, value = line.split('=', 1)
-                settings[key.strip()] = value.strip()
-        
-        return settings
-    
+
+        # The legacy parser stripped every line, so indentation never
+        # meant line continuation in this dialect; normalize before
+        # configparser gets a chance to fold indented lines into the
+        # previous value
+        text = '\n'.join(line.strip() for line in text.splitlines())
+
+        cp = INIParser._make_parser()
+        try:
+            cp.read_string(text)
+        except configparser.MissingSectionHeaderError:
+            # Tolerate bare key=value files by supplying a section header
+            text = '[Initialisation]\n' + text
+            cp = INIParser._make_parser()
+            try:
+                cp.read_string(text)
+            except configparser.Error:
+                cp = INIParser._read_tolerant(text)
+        except configparser.Error:
+            cp = INIParser._read_tolerant(text)
+
+        # Sections are flattened: the app treats settings as one namespace
+        return {
+            key: value
+            for section in cp.sections()
+            for key, value in cp.items(section)
+        }
+
+    @staticmethod
+    def _read_tolerant(text: str) -> configparser.ConfigParser:
+        """
+        Re-parse with malformed lines dropped. Lines that are neither
+        blank, a well-formed section header, a comment, nor a key=value
+        pair are skipped, as the original line loop did.
+        """
+        kept = [
+            line for line in text.splitlines()
+            if not line.strip()
+            or line.lstrip().startswith('#')
+            or '=' in line
+            or _INI_HEADER_RE.match(line)
+        ]
+        cp = INIParser._make_parser()
+        try:
+            cp.read_string('\n'.join(kept))
+        except configparser.Error as e:
+            raise ValueError(f"Cannot read INI file: {e}")
+        return cp
+
     @staticmethod
     def write(filepath: str, settings: Dict[str, str], section: str = "Initialisation"):
         """Write settings to INI format."""
-        lines = [f"[{section}]"]
-        
-        for key, value in settings.items():
-            lines.append(f"{key}={value}")
-        
+        cp = INIParser._make_parser()
+        cp[section] = settings
+
         with open(filepath, 'w', encoding='latin-1') as f:
-            f.write('\n'.join(lines))
+            cp.write(f, space_around_delimiters=False)
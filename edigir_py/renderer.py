@@ -3,6 +3,8 @@ LED Display Renderer for Edigir.
 Renders text on simulated LED matrix displays with animations.
 """
 
+import sys
+import threading
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Optional, Tuple
@@ -131,29 +133,95 @@ BUILTIN_FONT_5X7 = {
 }
 
 
+# Builtin glyphs packed into single 40-bit ints (8 bits per column, low
+# byte first, bit n = row n). The render loop walks lit bits only, so the
+# mostly-dark glyphs cost a handful of int ops instead of 35 bool tests.
+# Bit 7 of each column byte is masked off: the 5x7 grid has no row 7.
+_PACKED_5X7: Dict[str, int] = {
+    char: sum((col & 0x7f) << (i * 8) for i, col in enumerate(columns))
+    for char, columns in BUILTIN_FONT_5X7.items()
+}
+
+# Row-major bitmaps decoded once at import; the render loops ask for the
+# same glyphs every frame, so they get a shared read-only reference
+_BUILTIN_BITMAPS: Dict[str, List[List[bool]]] = {
+    char: [
+        [bool(columns[col] & (1 << row)) for col in range(5)]
+        for row in range(7)
+    ]
+    for char, columns in BUILTIN_FONT_5X7.items()
+}
+
+
 def get_builtin_char_bitmap(char: str) -> List[List[bool]]:
-    """Get bitmap for a character from the built-in font."""
-    columns = BUILTIN_FONT_5X7.get(char)
-    if columns is None:
-        columns = BUILTIN_FONT_5X7.get(' ')  # Default to space
-    
-    # Convert column bytes to 7-row bitmap
-    bitmap = []
-    for row in range(7):
-        row_pixels = []
-        for col in range(5):
-            if columns[col] & (1 << row):
-                row_pixels.append(True)
-            else:
-                row_pixels.append(False)
-        bitmap.append(row_pixels)
-    
+    """
+    Get bitmap for a character from the built-in font.
+
+    The returned rows are shared cached data — callers must not mutate them.
+    """
+    bitmap = _BUILTIN_BITMAPS.get(char)
+    if bitmap is None:
+        bitmap = _BUILTIN_BITMAPS[' ']  # Default to space
     return bitmap
 
 
+def _make_rows_data(pixel_size, pixel_gap, bg, off, glow_on, glow_color, segs):
+    """
+    Build a put()-string assembler specialized for one cell geometry.
+    Everything the hot path depends on — cell and gap sizes, background,
+    the glow decision — is constant-folded into the closure when the
+    canvas is set up, so per-call work is just joining cached segments.
+    """
+    pitch = pixel_size + pixel_gap
+
+    def seg(color, _get=segs.get):
+        s = _get(color)
+        if s is None:
+            if glow_on and color != off:
+                # Lit stamp: bright core with a dim halo filling the
+                # gap column and gap band below
+                halo = glow_color(color)
+                s = (
+                    (color + ' ') * pixel_size + (halo + ' ') * pixel_gap,
+                    (halo + ' ') * pitch,
+                )
+            else:
+                s = (
+                    (color + ' ') * pixel_size + (bg + ' ') * pixel_gap,
+                    (bg + ' ') * pitch,
+                )
+            segs[color] = s
+        return s
+
+    def rows_data(led_rows):
+        """Build the put() data string for a run of LED rows."""
+        rows = []
+        for row in led_rows:
+            pairs = list(map(seg, row))
+            line = ''.join([main for main, _band in pairs])[:-1]
+            rows.extend([line] * pixel_size)
+            if pixel_gap:
+                band = ''.join([band for _main, band in pairs])[:-1]
+                rows.extend([band] * pixel_gap)
+
+        return "{" + "} {".join(rows) + "}"
+
+    return rows_data
+
+
 class LEDRenderer:
     """Renders text on LED matrix displays with realistic LED effects."""
-    
+
+    __slots__ = (
+        'canvas', 'display_config', 'pixel_size', 'pixel_gap', '_pitch',
+        'fonts', 'palette', '_palette_hex', 'led_on_color', 'use_glow',
+        '_photo', '_img_id', '_geometry', '_prev_colors', '_off_grids',
+        '_off_band_cache', '_grid_pool', '_cell_segs', '_rows_data',
+        '_row_cache', '_width_cache', '_bitmap_cache', '_stream_cache',
+        '_frame_cache', '_glow_cache',
+    )
+
+
     # Standard LED colors
     LED_OFF = "#1a1a1a"
     LED_AMBER = "#ff6600"
@@ -168,138 +236,365 @@ class LEDRenderer:
     LED_DIM_GREEN = "#004d00"
     LED_DIM_RED = "#4d0000"
     LED_DIM_YELLOW = "#4d4d00"
-    
+
+    # Canvas / unlit-area background
+    CANVAS_BG = "#0a0a0a"
+
+    # Fallback palette used when no .ini palette is loaded
+    DEFAULT_COLORS = (
+        LED_OFF,
+        LED_WHITE,
+        LED_RED,
+        LED_GREEN,
+        "#0000ff",
+        LED_YELLOW,
+        "#ff00ff",
+        LED_CYAN,
+        LED_AMBER,
+    )
+
     def __init__(self, canvas: tk.Canvas, display_config: DisplayConfig):
         """Initialize renderer with canvas and display configuration."""
         self.canvas = canvas
         self.display_config = display_config
         self.pixel_size = 4
         self.pixel_gap = 1
+        self._pitch = self.pixel_size + self.pixel_gap
         self.fonts: Dict[str, Font] = {}
         self.palette: Optional[Palette] = None
+        self._palette_hex: List[str] = []
         self.led_on_color = self.LED_AMBER
         self.use_glow = True
-        
-        # Pixel buffer for efficient rendering
-        self._pixel_buffer: List[List[bool]] = []
-        
+
+        # Backing image: the whole matrix is one canvas item updated by blit
+        self._photo: Optional[tk.PhotoImage] = None
+        self._img_id: Optional[int] = None
+
+        # Section geometry tuples, derived from config and pitch once
+        self._geometry: Dict[int, Tuple[int, int, int]] = {}
+
+        # Last blitted frame per section, for diff-based partial updates
+        self._prev_colors: Dict[int, List[List[str]]] = {}
+
+        # All-off grids per section, built once and shared (never mutated)
+        self._off_grids: Dict[int, List[List[str]]] = {}
+
+        # Assembled all-off put() strings keyed by (section, first, last)
+        # row band, since clears repeat the same bands
+        self._off_band_cache: Dict[Tuple[int, int, int], str] = {}
+
+        # Recycled frame grids per section (at most two: one on screen as
+        # the diff reference, one being composed)
+        self._grid_pool: Dict[int, List[List[List[str]]]] = {}
+
+        # Per-color cell segments for put() row assembly: the tokens one
+        # LED contributes to an image row, built once per color
+        self._cell_segs: Dict[str, str] = {}
+
+        # Colorized glyph row templates keyed by (char, font_code, color):
+        # prebuilt lists the compositor copies with slice assignment
+        self._row_cache: Dict[Tuple[str, str, str], Tuple[List[List[str]], int]] = {}
+
+        # Advance widths keyed by (char, font_code), so offscreen glyphs
+        # can be skipped without touching their templates
+        self._width_cache: Dict[Tuple[str, str], int] = {}
+
+        # Raw (bitmap, width) pairs keyed by (char, font_code)
+        self._bitmap_cache: Dict[Tuple[str, str], Tuple[List[List[bool]], int]] = {}
+
+        # Preprocessed glyph streams keyed by (text, fonts, color),
+        # LRU-bounded: the per-character dispatch (specials, font codes,
+        # template lookups) runs once per distinct text
+        self._stream_cache: Dict[tuple, list] = {}
+
+        # Whole composed frames keyed by render signature, LRU-bounded.
+        # Blink and alternance cycles revisit the same few frames forever.
+        self._frame_cache: Dict[tuple, Tuple[int, List[List[str]]]] = {}
+
+        # Glow colors per LED color; the palette has a handful of entries,
+        # so after the first computation every lookup is a dict hit
+        self._glow_cache: Dict[str, str] = {
+            self.LED_AMBER: self.LED_DIM_AMBER,
+            self.LED_GREEN: self.LED_DIM_GREEN,
+            self.LED_RED: self.LED_DIM_RED,
+            self.LED_YELLOW: self.LED_DIM_YELLOW,
+        }
+
         # Calculate canvas size
         self._setup_canvas()
-    
+
     def _setup_canvas(self):
-        """Set up canvas dimensions based on display config."""
-        width = self.display_config.width1 * (self.pixel_size + self.pixel_gap)
-        height = self.display_config.height1 * (self.pixel_size + self.pixel_gap)
-        
+        """Set up canvas dimensions and the backing image."""
+        self._pitch = pitch = self.pixel_size + self.pixel_gap
+        width = self.display_config.width1 * pitch
+        height = self.display_config.height1 * pitch
+
         if self.display_config.is_bimode:
-            width = max(width, self.display_config.width2 * (self.pixel_size + self.pixel_gap))
-            height += self.display_config.height2 * (self.pixel_size + self.pixel_gap) + 10
-        
+            width = max(width, self.display_config.width2 * pitch)
+            height += self.display_config.height2 * pitch + 10
+
         self.canvas.configure(width=width + 20, height=height + 20)
-        self.canvas.configure(bg="#0a0a0a")
-        
-        # Initialize pixel buffer
-        self._pixel_buffer = [[False] * self.display_config.width1 
-                              for _ in range(self.display_config.height1)]
-    
+        self.canvas.configure(bg=self.CANVAS_BG)
+
+        # All pixels live in one PhotoImage shown by a single canvas item;
+        # frames are pushed with put() instead of per-LED canvas ovals
+        self.canvas.delete("all")
+        self._geometry = {}
+        self._prev_colors = {}
+        self._off_grids = {}
+        self._off_band_cache = {}
+        self._grid_pool = {}
+        self._cell_segs = {}
+        self._frame_cache = {}
+        # Specialized row assembler: the glow condition the oval renderer
+        # branched on per pixel is folded in here once (toggling use_glow
+        # therefore takes effect on the next canvas setup)
+        self._rows_data = _make_rows_data(
+            self.pixel_size, self.pixel_gap, self.CANVAS_BG, self.LED_OFF,
+            self.use_glow and self.pixel_size >= 4, self._get_glow_color,
+            self._cell_segs,
+        )
+        self._photo = tk.PhotoImage(width=max(width, 1), height=max(height, 1))
+        self._photo.put(self.CANVAS_BG, to=(0, 0, max(width, 1), max(height, 1)))
+        self._img_id = self.canvas.create_image(
+            10, 10, image=self._photo, anchor='nw'
+        )
+        self._draw_empty_matrix()
+
+    def update_config(self, display_config: DisplayConfig):
+        """
+        Switch to a new display geometry in place. The backing image and
+        geometry-bound state are rebuilt; the font-bound caches (glyph
+        templates, widths, streams) survive, unlike constructing a fresh
+        renderer.
+        """
+        self.display_config = display_config
+        self._setup_canvas()
+
     def set_fonts(self, fonts: Dict[str, Font]):
         """Set fonts for rendering."""
         self.fonts = fonts
-    
+        # Pack each glyph's rows into lit-bit masks once per load, so the
+        # template builder walks set bits instead of testing every pixel
+        for font in fonts.values():
+            for font_char in font.characters.values():
+                if font_char.row_masks is None and font_char.pixels:
+                    clip = (1 << font_char.width) - 1
+                    font_char.row_masks = [
+                        sum(1 << x for x, p in enumerate(row) if p) & clip
+                        for row in font_char.pixels
+                    ]
+        self._row_cache.clear()
+        self._width_cache.clear()
+        self._bitmap_cache.clear()
+        self._stream_cache.clear()
+        self._frame_cache.clear()
+
     def set_palette(self, palette: Palette):
         """Set color palette."""
         self.palette = palette
-    
+        # Interned '#rrggbb' strings per palette index, so get_color is a
+        # list lookup instead of an f-string allocation on every call
+        self._palette_hex = [
+            sys.intern('#' + color.rgb_hex) for color in palette.colors
+        ] if palette else []
+
     def set_led_color(self, color: str):
         """Set the LED on color."""
-        self.led_on_color = color
-    
+        self.led_on_color = sys.intern(color)
+
     def clear(self):
-        """Clear the display and draw empty matrix."""
-        self.canvas.delete("all")
-        self._pixel_buffer = [[False] * self.display_config.width1 
-                              for _ in range(self.display_config.height1)]
+        """Clear the display back to an all-off matrix."""
         self._draw_empty_matrix()
-    
+
+    def _section_geometry(self, section: int) -> Tuple[int, int, int]:
+        """Return (led_width, led_height, image_y_offset) for a section."""
+        geo = self._geometry.get(section)
+        if geo is None:
+            cfg = self.display_config
+            if section == 0:
+                geo = (cfg.width1, cfg.height1, 0)
+            else:
+                geo = (cfg.width2, cfg.height2, cfg.height1 * self._pitch + 10)
+            self._geometry[section] = geo
+        return geo
+
+    def _blit_section(self, colors: List[List[str]], section: int = 0):
+        """
+        Push one section's LED colors (a row-major grid of hex strings)
+        into the backing image with a single put() call.
+        """
+        if not colors or not colors[0]:
+            return
+
+        # Diff against the previous frame: most renders change only the
+        # band of rows the text occupies, and repeat frames change nothing
+        prev = self._prev_colors.get(section)
+        first = 0
+        last = len(colors) - 1
+        if prev is not None and len(prev) == len(colors):
+            while first <= last and prev[first] == colors[first]:
+                first += 1
+            if first > last:
+                return  # Frame identical to what is on screen
+            while prev[last] == colors[last]:
+                last -= 1
+        self._prev_colors[section] = colors
+
+        pitch = self._pitch
+        if colors is self._off_grids.get(section):
+            # Clears recur with the same band (blink cycles); reuse the
+            # assembled all-off string instead of rebuilding it each time
+            key = (section, first, last)
+            data = self._off_band_cache.get(key)
+            if data is None:
+                data = self._rows_data(colors[first:last + 1])
+                self._off_band_cache[key] = data
+        else:
+            data = self._rows_data(colors[first:last + 1])
+        y0 = self._section_geometry(section)[2]
+        self._photo.put(data, to=(0, y0 + first * pitch))
+
+    def _off_grid(self, section: int) -> List[List[str]]:
+        """Get the cached all-off grid for a section."""
+        grid = self._off_grids.get(section)
+        if grid is None:
+            w, h, _ = self._section_geometry(section)
+            grid = [[self.LED_OFF] * w for _ in range(h)]
+            self._off_grids[section] = grid
+        return grid
+
+    def _working_grid(self, section: int) -> List[List[str]]:
+        """
+        Get an all-off frame grid to compose into, recycling a pooled grid
+        whenever one is not currently on screen as the diff reference.
+        """
+        prev = self._prev_colors.get(section)
+        pool = self._grid_pool.setdefault(section, [])
+        off_grid = self._off_grid(section)
+        off_row = off_grid[0] if off_grid else []
+
+        for grid in pool:
+            if grid is not prev:
+                for row in grid:
+                    row[:] = off_row
+                return grid
+
+        w, h, _ = self._section_geometry(section)
+        grid = [[self.LED_OFF] * w for _ in range(h)]
+        pool.append(grid)
+        return grid
+
+    def _draw_empty_matrix(self):
+        """Blit the all-off matrix into the backing image."""
+        self._blit_section(self._off_grid(0), section=0)
+
+        if self.display_config.is_bimode:
+            self._blit_section(self._off_grid(1), section=1)
+
     def _get_glow_color(self, color: str) -> str:
         """Get dim glow color for LED effect."""
-        if color == self.LED_AMBER:
-            return self.LED_DIM_AMBER
-        elif color == self.LED_GREEN:
-            return self.LED_DIM_GREEN
-        elif color == self.LED_RED:
-            return self.LED_DIM_RED
-        elif color == self.LED_YELLOW:
-            return self.LED_DIM_YELLOW
-        else:
-            # Calculate dim version with validation
-            try:
-                hex_color = color.lstrip('#')
-                if len(hex_color) != 6:
-                    return self.LED_DIM_AMBER  # Default fallback
+        glow = self._glow_cache.get(color)
+        if glow is not None:
+            return glow
+
+        # Calculate dim version with validation
+        try:
+            hex_color = color.lstrip('#')
+            if len(hex_color) != 6:
+                glow = self.LED_DIM_AMBER  # Default fallback
+            else:
                 r = int(hex_color[0:2], 16) // 3
                 g = int(hex_color[2:4], 16) // 3
                 b = int(hex_color[4:6], 16) // 3
-                return f"#{r:02x}{g:02x}{b:02x}"
-            except (ValueError, IndexError):
-                return self.LED_DIM_AMBER  # Default fallback
-    
-    def _draw_empty_matrix(self):
-        """Draw empty LED matrix background."""
-        offset_x = 10
-        offset_y = 10
-        
-        # Draw first matrix section
-        for y in range(self.display_config.height1):
-            for x in range(self.display_config.width1):
-                self._draw_pixel(x, y, self.LED_OFF, offset_x, offset_y)
-        
-        # Draw second matrix section if bimode
-        if self.display_config.is_bimode:
-            offset_y += self.display_config.height1 * (self.pixel_size + self.pixel_gap) + 10
-            for y in range(self.display_config.height2):
-                for x in range(self.display_config.width2):
-                    self._draw_pixel(x, y, self.LED_OFF, offset_x, offset_y)
-    
-    def _draw_pixel(self, x: int, y: int, color: str, offset_x: int = 0, offset_y: int = 0):
-        """Draw a single LED pixel with optional glow effect."""
-        px = offset_x + x * (self.pixel_size + self.pixel_gap)
-        py = offset_y + y * (self.pixel_size + self.pixel_gap)
-        
-        # Draw glow effect for lit pixels
-        if self.use_glow and color != self.LED_OFF and self.pixel_size >= 4:
-            glow_color = self._get_glow_color(color)
-            glow_size = self.pixel_size + 2
-            self.canvas.create_oval(
-                px - 1, py - 1,
-                px + glow_size - 1, py + glow_size - 1,
-                fill=glow_color,
-                outline="",
-                tags="glow"
-            )
-        
-        # Draw the main LED
-        self.canvas.create_oval(
-            px, py,
-            px + self.pixel_size, py + self.pixel_size,
-            fill=color,
-            outline="",
-            tags="led"
-        )
+                glow = f"#{r:02x}{g:02x}{b:02x}"
+        except (ValueError, IndexError):
+            glow = self.LED_DIM_AMBER  # Default fallback
+
+        self._glow_cache[color] = glow
+        return glow
     
+    def _glyph_rows(self, char: str, font_code: str,
+                    color: str) -> Tuple[List[List[str]], int]:
+        """
+        Get the colorized row templates for a glyph: per row, a list of
+        `width` color strings (lit cells in `color`, the rest LED_OFF),
+        ready to copy into a frame grid with slice assignment.
+        """
+        key = (char, font_code, color)
+        entry = self._row_cache.get(key)
+        if entry is not None:
+            return entry
+
+        off = self.LED_OFF
+        font = self.fonts.get(font_code) or self.fonts.get('2')
+        font_char = font.get_char(char) if font else None
+
+        if font_char and font_char.pixels:
+            width = font_char.width
+            masks = font_char.row_masks
+            if masks is None:
+                # Font was set without going through set_fonts
+                clip = (1 << width) - 1
+                masks = font_char.row_masks = [
+                    sum(1 << x for x, p in enumerate(row) if p) & clip
+                    for row in font_char.pixels
+                ]
+            rows = []
+            for v in masks:
+                out = [off] * width
+                while v:
+                    bit = v & -v
+                    v ^= bit
+                    out[bit.bit_length() - 1] = color
+                rows.append(out)
+        else:
+            # Builtin glyph: expand the packed int, visiting lit bits only
+            width = 5
+            rows = [[off] * 5 for _ in range(7)]
+            v = _PACKED_5X7.get(char, 0)
+            while v:
+                bit = v & -v
+                v ^= bit
+                col, row = divmod(bit.bit_length() - 1, 8)
+                rows[row][col] = color
+
+        entry = (rows, width)
+        self._row_cache[key] = entry
+        return entry
+
+    def _char_width(self, char: str, font_code: str) -> int:
+        """Get a glyph's width in LEDs without building its templates."""
+        key = (char, font_code)
+        width = self._width_cache.get(key)
+        if width is None:
+            font = self.fonts.get(font_code) or self.fonts.get('2')
+            font_char = font.get_char(char) if font else None
+            width = font_char.width if font_char and font_char.pixels else 5
+            self._width_cache[key] = width
+        return width
+
     def _get_char_bitmap(self, char: str, font_code: str = '2') -> Tuple[List[List[bool]], int]:
         """Get bitmap for a character. Returns (bitmap, width)."""
+        key = (char, font_code)
+        hit = self._bitmap_cache.get(key)
+        if hit is not None:
+            return hit
+
         # First try to use loaded font
         font = self.fonts.get(font_code) or self.fonts.get('2')
-        
+
         if font:
             font_char = font.get_char(char)
             if font_char and font_char.pixels:
-                return font_char.pixels, font_char.width
-        
+                hit = (font_char.pixels, font_char.width)
+                self._bitmap_cache[key] = hit
+                return hit
+
         # Fall back to built-in font
-        bitmap = get_builtin_char_bitmap(char)
-        return bitmap, 5  # Built-in font is 5 pixels wide
+        hit = (get_builtin_char_bitmap(char), 5)  # Built-in font is 5 wide
+        self._bitmap_cache[key] = hit
+        return hit
     
     def render_text(self, text: str, fonts: str = "", 
                     text_color: str = None, section: int = 0,
@@ -317,26 +612,64 @@ class LEDRenderer:
         Returns:
             Total width of rendered text in pixels
         """
-        self.clear()
-        
         if not text_color:
             text_color = self.led_on_color
-        
-        # Determine display section
-        if section == 0:
-            display_width = self.display_config.width1
-            display_height = self.display_config.height1
-            offset_y = 10
-        else:
-            display_width = self.display_config.width2
-            display_height = self.display_config.height2
-            offset_y = 10 + self.display_config.height1 * (self.pixel_size + self.pixel_gap) + 10
-        
-        offset_x = 10
-        
-        # Render each character
-        current_x = -scroll_offset
-        
+
+        # Repeat frames (blink, alternance cycles) come out of the cache;
+        # the blit differ then usually has little or nothing to push
+        key = (text, fonts, text_color, section, scroll_offset)
+        cache = self._frame_cache
+        hit = cache.get(key)
+        if hit is not None:
+            # Refresh LRU position
+            del cache[key]
+            cache[key] = hit
+            width, colors = hit
+            self._blit_section(colors, section)
+            return width
+
+        display_width, display_height, _ = self._section_geometry(section)
+
+        # Compose the frame off-screen, then push it in one blit
+        stream = self.build_glyph_stream(text, fonts, text_color)
+        colors = self._working_grid(section)
+        width = self._compose_stream(
+            colors, stream, display_width, display_height, scroll_offset
+        )
+        self._blit_section(colors, section)
+
+        # Cache a snapshot (the working grid itself gets recycled)
+        cache[key] = (width, [row[:] for row in colors])
+        if len(cache) > 64:
+            del cache[next(iter(cache))]
+
+        return width
+
+    def build_glyph_stream(self, text: str, fonts: str = "",
+                           text_color: str = None) -> List[Tuple[Optional[List[List[str]]], int]]:
+        """
+        Resolve text once into a flat list of (rows, advance) pairs —
+        rows is None for pure column skips. Animations reuse the stream
+        across frames instead of re-dispatching per character each tick.
+        """
+        # Intern the color so every frame's cells reference one string
+        # object and the blit differ compares rows by identity, not text
+        text_color = sys.intern(text_color) if text_color else self.led_on_color
+
+        # Streams are immutable once built (the compositor only reads
+        # them), so distinct texts come straight out of an LRU cache
+        key = (text, fonts, text_color)
+        cache = self._stream_cache
+        stream = cache.get(key)
+        if stream is not None:
+            del cache[key]
+            cache[key] = stream
+            return stream
+
+        glyph_rows = self._glyph_rows
+        n_fonts = len(fonts)
+        stream = []
+
         for i, char in enumerate(text):
             # Handle special characters
             if char == '|' or char == '¦':
@@ -344,58 +677,152 @@ class LEDRenderer:
                 continue
             elif char == '²':
                 # Single column skip
-                current_x += 1
+                stream.append((None, 1))
                 continue
-            
-            # Get font code for this character
-            font_code = fonts[i] if i < len(fonts) else '2'
-            
-            # Get character bitmap
-            bitmap, char_width = self._get_char_bitmap(char, font_code)
-            char_height = len(bitmap)
-            
-            # Center vertically
-            y_start = (display_height - char_height) // 2
-            
-            # Render character pixels
-            for y, row in enumerate(bitmap):
-                for x, pixel in enumerate(row):
-                    if pixel:
-                        screen_x = current_x + x
-                        screen_y = y_start + y
-                        
-                        # Only draw if within display bounds
-                        if 0 <= screen_x < display_width and 0 <= screen_y < display_height:
-                            self._draw_pixel(
-                                screen_x, screen_y, text_color,
-                                offset_x, offset_y
-                            )
-            
-            current_x += char_width + 1  # Add character spacing
-        
+
+            rows, char_width = glyph_rows(
+                char, fonts[i] if i < n_fonts else '2', text_color
+            )
+            stream.append((rows, char_width + 1))  # Advance includes spacing
+
+        cache[key] = stream
+        if len(cache) > 64:
+            del cache[next(iter(cache))]
+
+        return stream
+
+    def _compose_stream(self, colors: List[List[str]],
+                        stream: List[Tuple[Optional[List[List[str]]], int]],
+                        display_width: int, display_height: int,
+                        scroll_offset: int) -> int:
+        """Compose a glyph stream into a frame grid; returns text width."""
+        current_x = -scroll_offset
+
+        for i, (rows, advance) in enumerate(stream):
+            if current_x >= display_width:
+                # Everything from here on is right of the viewport;
+                # advances only grow current_x, so just sum the rest
+                current_x += sum(adv for _rows, adv in stream[i:])
+                break
+
+            if rows is None:
+                current_x += advance
+                continue
+
+            char_width = advance - 1
+            # During scroll most glyphs are entirely offscreen — skip them
+            if current_x + char_width < 0:
+                current_x += advance
+                continue
+
+            # Center vertically; clip both axes up front so the copy loop
+            # is nothing but slice assignments
+            y_start = (display_height - len(rows)) // 2
+            x0 = -current_x if current_x < 0 else 0
+            x1 = min(char_width, display_width - current_x)
+            y0 = -y_start if y_start < 0 else 0
+            y1 = min(len(rows), display_height - y_start)
+            if x0 < x1:
+                for y in range(y0, y1):
+                    colors[y_start + y][current_x + x0:current_x + x1] = rows[y][x0:x1]
+
+            current_x += advance
+
         return current_x + scroll_offset  # Return total width
-    
+
+    def compose_frame(self, text: str, fonts: str = "",
+                      text_color: str = None, section: int = 0,
+                      scroll_offset: int = 0) -> Tuple[int, Optional[tuple]]:
+        """
+        Compose a frame without touching Tk, so it can run on a worker
+        thread. Returns (text_width, blit) where blit is an opaque payload
+        for apply_blit, or None when the section has no pixels.
+        """
+        stream = self.build_glyph_stream(text, fonts, text_color)
+        return self.compose_stream_frame(stream, section, scroll_offset)
+
+    def compose_stream_frame(self, stream, section: int = 0,
+                             scroll_offset: int = 0) -> Tuple[int, Optional[tuple]]:
+        """Compose a frame from a prebuilt glyph stream (Tk-free)."""
+        display_width, display_height, _ = self._section_geometry(section)
+        if display_width <= 0 or display_height <= 0:
+            return 0, None
+
+        colors = [[self.LED_OFF] * display_width for _ in range(display_height)]
+        width = self._compose_stream(
+            colors, stream, display_width, display_height, scroll_offset
+        )
+        return width, (section, colors, self._rows_data(colors))
+
+    def apply_blit(self, blit: Optional[tuple]):
+        """Push a frame composed by compose_frame (Tk thread only)."""
+        if blit is None:
+            return
+        section, colors, data = blit
+        y0 = self._section_geometry(section)[2]
+        self._photo.put(data, to=(0, y0))
+        # The whole section was rewritten; keep the diff reference honest
+        self._prev_colors[section] = colors
+
+    def compose_scroll_strip(self, stream, section: int = 0) -> Tuple[int, Optional[tuple]]:
+        """
+        Compose the whole text once as one wide strip (Tk-free). The strip
+        carries a viewport of blank columns on the left and enough blank
+        columns on the right to cover the last offset before the scroll
+        wraps, so every animation frame is a window of it. Returns
+        (text_width, strip_data) for make_strip_photo, strip_data being
+        None when the section has no pixels.
+        """
+        display_width, display_height, _ = self._section_geometry(section)
+        if display_width <= 0 or display_height <= 0:
+            return 0, None
+
+        text_width = sum(advance for _rows, advance in stream)
+        strip_width = text_width + 3 * display_width
+        colors = [[self.LED_OFF] * strip_width for _ in range(display_height)]
+        self._compose_stream(
+            colors, stream, strip_width, display_height, -display_width
+        )
+        pitch = self._pitch
+        return text_width, (
+            self._rows_data(colors),
+            strip_width * pitch,
+            display_height * pitch,
+        )
+
+    def make_strip_photo(self, strip_data: tuple) -> tk.PhotoImage:
+        """Upload a composed strip into a PhotoImage (Tk thread only)."""
+        data, width, height = strip_data
+        photo = tk.PhotoImage(width=width, height=height)
+        photo.put(data)
+        return photo
+
+    def blit_strip_window(self, strip: tk.PhotoImage, scroll_offset: int,
+                          section: int = 0):
+        """
+        Copy the viewport-sized window of a scroll strip into the backing
+        image: one C-level region copy per frame, no Python compositing.
+        """
+        display_width, display_height, y0 = self._section_geometry(section)
+        pitch = self._pitch
+        x0 = (display_width + scroll_offset) * pitch
+        self._photo.tk.call(
+            str(self._photo), 'copy', str(strip),
+            '-from', x0, 0, x0 + display_width * pitch, display_height * pitch,
+            '-to', 0, y0,
+        )
+        # The copy bypasses the grid bookkeeping; drop the diff reference
+        # so the next grid render blits in full
+        self._prev_colors.pop(section, None)
+
     def get_color(self, index: int) -> str:
         """Get color from palette by index."""
-        if self.palette:
-            color = self.palette.get_color(index)
-            if color:
-                return f"#{color.rgb_hex}"
-        
+        hexes = self._palette_hex
+        if 0 <= index < len(hexes):
+            return hexes[index]
+
         # Default colors if no palette
-        default_colors = [
-            self.LED_OFF,
-            self.LED_WHITE,
-            self.LED_RED,
-            self.LED_GREEN,
-            "#0000ff",
-            self.LED_YELLOW,
-            "#ff00ff",
-            self.LED_CYAN,
-            self.LED_AMBER,
-        ]
-        
-        return default_colors[index % len(default_colors)]
+        return self.DEFAULT_COLORS[index % len(self.DEFAULT_COLORS)]
 
 
 class DisplayPreview(ttk.Frame):
@@ -440,11 +867,21 @@ class DisplayPreview(ttk.Frame):
         self._animation_color = None
         self._animation_speed = 50
         self._animation_type = AnimationType.STATIC
+
+        # Scroll strip: the whole text pre-rendered once as a wide image;
+        # each tick copies a viewport-sized window of it (kept referenced
+        # here so Tk does not garbage-collect the image). Composition runs
+        # on a worker thread; the tick loop picks up the finished strip.
+        self._scroll_strip: Optional[tk.PhotoImage] = None
+        self._pending_strip: Optional[tuple] = None
+        self._strip_stop: Optional[threading.Event] = None
     
     def set_display_config(self, config: DisplayConfig):
         """Update display configuration."""
+        # A running animation holds frames sized to the old geometry
+        self.stop_animation()
         self.display_config = config
-        self.renderer = LEDRenderer(self.canvas, config)
+        self.renderer.update_config(config)
     
     def set_fonts(self, fonts: Dict[str, Font]):
         """Set fonts for rendering."""
@@ -477,7 +914,20 @@ class DisplayPreview(ttk.Frame):
         self._animation_color = text_color
         self._animation_speed = speed
         self._scroll_offset = 0
-        
+
+        # Pre-render the whole text as one strip image; every frame of
+        # the animation is then a single C-level window copy out of it.
+        # Composing a long text can take a visible moment, so it runs on
+        # a worker (it never touches Tk) and the tick loop starts blitting
+        # once the strip is ready.
+        stream = self.renderer.build_glyph_stream(text, fonts, text_color)
+        stop = self._strip_stop = threading.Event()
+        threading.Thread(
+            target=self._compose_strip_async,
+            args=(stop, stream),
+            daemon=True,
+        ).start()
+
         self._animate_scroll()
     
     def start_blink_animation(self, text: str, fonts: str = "",
@@ -520,30 +970,54 @@ class DisplayPreview(ttk.Frame):
     def stop_animation(self):
         """Stop any running animation."""
         self._animation_running = False
+        self._scroll_strip = None
+        self._pending_strip = None
+        if self._strip_stop is not None:
+            self._strip_stop.set()
+            self._strip_stop = None
         if self._animation_timer:
             self.after_cancel(self._animation_timer)
             self._animation_timer = None
-    
+
+    def _compose_strip_async(self, stop: threading.Event, stream: list):
+        """Worker: compose the scroll strip without touching Tk."""
+        width, strip_data = self.renderer.compose_scroll_strip(stream)
+        # Tag the result with this run's stop event: the tick loop only
+        # adopts it while that event is still the current generation, so
+        # a worker finishing after stop/restart can never leak a stale
+        # strip into the new animation
+        self._pending_strip = (stop, width, strip_data)
+
     def _animate_scroll(self):
-        """Animation loop for scrolling text."""
+        """Animation tick: copy the next window out of the strip image."""
         if not self._animation_running:
             return
-        
-        self._text_width = self.renderer.render_text(
-            self._animation_text, 
-            self._animation_fonts, 
-            self._animation_color, 
-            scroll_offset=self._scroll_offset
-        )
-        
+
+        if self._scroll_strip is None and self._pending_strip is not None:
+            # Worker finished; upload the strip on the Tk thread,
+            # discarding results from a superseded animation run
+            stop, width, strip_data = self._pending_strip
+            self._pending_strip = None
+            if stop is self._strip_stop:
+                self._text_width = width
+                if strip_data is not None:
+                    self._scroll_strip = self.renderer.make_strip_photo(
+                        strip_data
+                    )
+
+        if self._scroll_strip is not None:
+            self.renderer.blit_strip_window(
+                self._scroll_strip, self._scroll_offset
+            )
+
         self._scroll_offset += 1
-        
-        # Reset when text scrolls off screen - use negative offset for seamless loop
+        # Reset when text scrolls off screen - use negative offset
+        # for seamless loop
         if self._scroll_offset > self._text_width + self.display_config.width1:
             self._scroll_offset = -self.display_config.width1
-        
+
         self._animation_timer = self.after(
-            self._animation_speed, 
+            self._animation_speed,
             self._animate_scroll
         )
     